@@ -0,0 +1,169 @@
+import os
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Generic, Hashable, Optional, TypeVar, Union
+
+from jinja2 import Environment, FileSystemBytecodeCache, Template
+
+from .utils import FileCoercible, Readable, contents_of_file_coercible
+
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+BYTECODE_CACHE_ENV_VAR = 'PREMARK_BYTECODE_CACHE_DIR'
+
+
+logger = logging.getLogger(__name__)
+
+
+class LRUCache(Generic[K, V]):
+    '''
+    A thread-safe mapping that holds at most `maxsize` of its most recently used items.
+    '''
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize < 1:
+            raise ValueError('`maxsize` must be at least 1.')
+        self.maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return None
+            return self._data[key]
+
+    def put(self, key: K, value: V) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+def file_key(f: Union[str, Path]) -> tuple[str, int, int]:
+    '''
+    Identify the current version of a file by its path, modification time, and size.
+    '''
+    path = os.path.abspath(f)
+    stat = os.stat(path)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+def content_key(contents: str) -> str:
+    '''Identify a piece of text by a hash of its contents.'''
+    return hashlib.sha256(contents.encode('utf8')).hexdigest()
+
+
+class TemplateCache:
+    '''
+    A cache of compiled Jinja2 templates and stylesheet contents.
+
+    Files given as paths are keyed on their path, modification time, and size, so edits
+    are picked up automatically. File-like objects have to be read anyway, so templates
+    read from them are keyed on a hash of their contents.
+
+    Parameters
+    ----------
+    maxsize
+        The number of templates (and, separately, stylesheets) to hold in memory.
+    bytecode_cache_dir
+        A directory in which to store compiled template bytecode, so that new processes
+        can skip compilation. If None, bytecode is cached only in memory.
+    '''
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        bytecode_cache_dir: Union[str, Path, None] = None,
+    ):
+        self.environment = Environment()
+        self._templates: LRUCache[Hashable, Template] = LRUCache(maxsize)
+        self._stylesheets: LRUCache[Hashable, str] = LRUCache(maxsize)
+        if bytecode_cache_dir is not None:
+            self.enable_bytecode_cache(bytecode_cache_dir)
+
+    def enable_bytecode_cache(self, directory: Union[str, Path]) -> None:
+        '''
+        Store compiled template bytecode on disk, in `directory`.
+        '''
+        os.makedirs(directory, exist_ok=True)
+        self.environment.bytecode_cache = FileSystemBytecodeCache(str(directory))
+        logger.debug('Caching template bytecode in %s', directory)
+
+    def get_template(self, f: FileCoercible) -> Template:
+        '''
+        Get the compiled template for a file, compiling it only if not already cached.
+        '''
+        if isinstance(f, Readable):
+            source = contents_of_file_coercible(f)
+            key: Hashable = content_key(source)
+            name = f'<{key}>'
+            template = self._templates.get(key)
+            if template is None:
+                template = self._compile(source, name)
+                self._templates.put(key, template)
+            return template
+        key = file_key(f)
+        template = self._templates.get(key)
+        if template is None:
+            logger.debug('Compiling template %s', f)
+            template = self._compile(contents_of_file_coercible(f), key[0])
+            self._templates.put(key, template)
+        return template
+
+    def get_stylesheet(self, f: FileCoercible) -> str:
+        '''
+        Get the contents of a stylesheet, reading it only if not already cached.
+        '''
+        if isinstance(f, Readable):
+            return contents_of_file_coercible(f)
+        key = file_key(f)
+        styles = self._stylesheets.get(key)
+        if styles is None:
+            styles = contents_of_file_coercible(f)
+            self._stylesheets.put(key, styles)
+        return styles
+
+    def clear(self) -> None:
+        '''Empty the in-memory caches. Bytecode stored on disk is kept.'''
+        self._templates.clear()
+        self._stylesheets.clear()
+
+    def _compile(self, source: str, name: str) -> Template:
+        env = self.environment
+        bcc = env.bytecode_cache
+        bucket = None
+        code = None
+        if bcc is not None:
+            bucket = bcc.get_bucket(env, name, None, source)
+            code = bucket.code
+        if code is None:
+            code = env.compile(source, name)
+            if bucket is not None:
+                bucket.code = code
+                bcc.set_bucket(bucket)  # type: ignore[union-attr]
+        return env.template_class.from_code(env, code, env.make_globals(None))
+
+
+# The cache shared by all presentations in this process.
+default_cache = TemplateCache(bytecode_cache_dir=os.environ.get(BYTECODE_CACHE_ENV_VAR))
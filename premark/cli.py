@@ -1,10 +1,11 @@
 import sys
 import logging
-from typing import Optional, TextIO
+from typing import Any, Optional, TextIO
 
 import click
 
 from .presentation import Presentation
+from .watch import Watcher
 
 
 logger = logging.getLogger(__name__)
@@ -23,6 +24,18 @@ DEFAULT_CONFIG_FILE = 'premark.yaml'
     type=click.Path(exists=True, file_okay=True, dir_okay=False),
     help="Custom Jinja2 HTML template for the presentation",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Number of section files to read in parallel.",
+)
+@click.option(
+    "--watch",
+    "-w",
+    is_flag=True,
+    help="Rebuild the output file whenever the inputs change.",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Output debugging info.")
 @click.option("--title", "-t", help="HTML title of the presentation")
 @click.option(
@@ -49,6 +62,8 @@ def premark(
     outfile: TextIO,
     title: Optional[str],
     verbose: bool,
+    watch: bool,
+    jobs: Optional[int],
     html: Optional[str],
     stylesheet: Optional[str],
 ) -> None:
@@ -71,15 +86,40 @@ def premark(
         config,
         outfile,
     )
-    prez = Presentation(
-        source,
-        html_template=html,
-        stylesheet=stylesheet,
-        title=title,
-        config_file=config
-    )
-    output_html = prez.to_html()
-    outfile.write(output_html)
+    presentation_args: dict[str, Any] = {
+        'html_template': html,
+        'stylesheet': stylesheet,
+        'title': title,
+        'config_file': config,
+        'jobs': jobs,
+    }
+    if watch:
+        if outfile is sys.stdout:
+            raise click.UsageError('--watch requires --outfile.')
+        _watch(source, outfile, presentation_args)
+        return
+    prez = Presentation(source, **presentation_args)
+    prez.write_html(outfile)
+
+
+def _watch(
+    source: Optional[str],
+    outfile: TextIO,
+    presentation_args: dict[str, Any],
+) -> None:
+    def write(prez: Presentation) -> None:
+        outfile.seek(0)
+        outfile.truncate()
+        prez.write_html(outfile)
+        outfile.flush()
+        click.echo(f"Built {outfile.name}", err=True)
+
+    watcher = Watcher(on_build=write, source=source, **presentation_args)
+    click.echo(f"Watching {source} for changes. Press Ctrl+C to stop.", err=True)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        pass
 
 
 if __name__ == "__main__":
@@ -1,17 +1,56 @@
 import logging
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Union, MutableMapping, Mapping, Type, Iterator, TypeVar
 from typing import ItemsView, KeysView, ValuesView
 
 import yaml
 
-from .utils import pkg_file, FileCoercible, contents_of_file_coercible
+from .cache import LRUCache, file_key
+from .utils import pkg_file, FileCoercible, Readable, contents_of_file_coercible
 
 
 P = TypeVar('P', bound='PartialConfig')
 
+# Use libyaml's much faster parser when it's available.
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 logger = logging.getLogger(__name__)
 
+# Parsed config files, keyed by path, modification time, and size.
+_parsed_files: LRUCache[Any, Mapping[str, Any]] = LRUCache(maxsize=256)
+
+
+def _freeze(value: Any) -> Any:
+    '''Recursively convert dicts and lists to read-only equivalents.'''
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    '''Convert the read-only containers made by `_freeze` back to dicts and lists.'''
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+@lru_cache(maxsize=None)
+def default_config() -> Mapping[str, Any]:
+    '''
+    The package's default configuration.
+
+    This is parsed only once per process and is read-only, so a single copy can be
+    shared by every presentation.
+    '''
+    config = PartialConfig.from_file(pkg_file('default_config.yaml'))
+    return _freeze(config)
+
 
 class PartialConfig(MutableMapping[str, Any]):
 
@@ -38,9 +77,20 @@ class PartialConfig(MutableMapping[str, Any]):
     ) -> P:
         '''
         Generate a config from a file or a path to a file.
+
+        Files given as paths are only parsed again if they have changed since they were
+        last read.
         '''
-        contents = contents_of_file_coercible(file)
-        return cls.from_yaml(contents)
+        if isinstance(file, Readable):
+            return cls.from_yaml(contents_of_file_coercible(file))
+        key = file_key(file)
+        parsed = _parsed_files.get(key)
+        if parsed is None:
+            logger.debug('Parsing config file %s', file)
+            contents = contents_of_file_coercible(file)
+            parsed = _freeze(yaml.load(contents, Loader=SafeLoader) or {})
+            _parsed_files.put(key, parsed)
+        return cls(_thaw(parsed))
 
     @classmethod
     def from_yaml(
@@ -51,7 +101,7 @@ class PartialConfig(MutableMapping[str, Any]):
         '''
         Generate a config from a string or bytes of valid yaml.
         '''
-        conf = yaml.load(_yaml, Loader=yaml.SafeLoader)
+        conf = yaml.load(_yaml, Loader=SafeLoader)
         return cls(conf)
 
     def items(self) -> ItemsView[str, Any]:
@@ -1,28 +1,33 @@
-from functools import reduce
-from operator import add
 import logging
 from pathlib import Path
 from collections import ChainMap
 import json
-from typing import Any, Union, Iterable, Optional, Mapping
+from typing import Any, Union, Iterable, Iterator, Optional, Mapping
 
-from jinja2 import Template
-
-from .config import PartialConfig
-from .section import Section
-from .utils import pkg_file, FileCoercible, contents_of_file_coercible
+from .cache import default_cache
+from .config import PartialConfig, default_config
+from .section import Section, SectionCache, read_sections
+from .utils import FileCoercible, Writable, contents_of_file_coercible
 
 
 logger = logging.getLogger(__name__)
 
+SLIDE_SEPARATOR = '\n---\n'
+
 
 class Presentation:
     '''
     A RemarkJS presentation.
     '''
-    source: str
-    markdown: str
+    source: Optional[FileCoercible]
     config: Mapping[str, Any]
+    sections: list[Section]
+    # The markdown is kept as a list of chunks (e.g. one per section), joined by slide
+    # separators, so that presentations can be concatenated without copying text.
+    _markdown_chunks: list[str]
+    _markdown: Optional[str]
+    # Files read to build the presentation, other than the template and stylesheet.
+    _input_paths: list[Path]
 
     def __init__(
         self,
@@ -33,6 +38,8 @@ class Presentation:
         stylesheet: FileCoercible = None,
         title: Optional[str] = None,
         config_file: FileCoercible = None,
+        jobs: Optional[int] = None,
+        section_cache: Optional[SectionCache] = None,
     ):
         '''
         Create a new Presentation.
@@ -55,6 +62,12 @@ class Presentation:
             The title of the presentation.
         config_file
             A yaml file containing some or all of the above config options.
+        jobs
+            The number of threads with which to read section files, when `sections` is
+            specified in config. By default, files are read one at a time.
+        section_cache
+            A cache of section markdown, shared between builds of the same presentation
+            so that only the sections that have changed are read again.
         '''
         if (source and markdown) or (not source and not markdown):
             msg = 'Exactly one of `source` and `markdown` args must be passed.'
@@ -73,9 +86,15 @@ class Presentation:
             file_config = PartialConfig.from_file(config_file)
         else:
             file_config = PartialConfig({})
-        default_config = PartialConfig.from_file(pkg_file('default_config.yaml'))
-        # Store configs in order of priority.
-        self.config = ChainMap(arg_config, file_config, default_config)
+        # Store configs in order of priority. A ChainMap only ever writes to its first
+        # mapping, so the read-only defaults can be shared safely.
+        defaults: Any = default_config()
+        self.config = ChainMap(arg_config, file_config, defaults)
+        self.source = source
+        self.sections = []
+        self._input_paths = []
+        if isinstance(config_file, (str, Path)):
+            self._input_paths.append(Path(config_file))
 
         # Create or simply store the underlying markdown.
         if 'sections' in self.config:
@@ -92,10 +111,18 @@ class Presentation:
                        '`sections` is specified in config.')
                 raise TypeError(msg)
             sections = Section.from_entries(self.config['sections'], parent_dir=source)
-            self.markdown = '\n---\n'.join(s.markdown() for s in sections)
+            self.sections = list(sections)
+            self._input_paths.extend(s.filename for s in self.sections)
+            self._markdown_chunks = read_sections(
+                self.sections,
+                jobs=jobs,
+                cache=section_cache,
+            )
         elif source:
             try:
-                self.markdown = contents_of_file_coercible(source)
+                self._markdown_chunks = [contents_of_file_coercible(source)]
+                if isinstance(source, (str, Path)):
+                    self._input_paths.append(Path(source))
             except IsADirectoryError as exc:
                 msg = ('`source` arg must be a file if `sections` is not specified in '
                        'config.`')
@@ -104,7 +131,41 @@ class Presentation:
             if markdown is None:
                 msg = 'If `source` arg is None, `markdown` must be specified.'
                 raise ValueError(msg)
-            self.markdown = markdown
+            self._markdown_chunks = [markdown]
+        self._markdown = None
+
+    @property
+    def markdown(self) -> str:
+        '''The full markdown of the presentation.'''
+        if self._markdown is None:
+            if len(self._markdown_chunks) == 1:
+                self._markdown = self._markdown_chunks[0]
+            else:
+                self._markdown = SLIDE_SEPARATOR.join(self._markdown_chunks)
+        return self._markdown
+
+    @markdown.setter
+    def markdown(self, markdown: str) -> None:
+        self._markdown_chunks = [markdown]
+        self._markdown = markdown
+
+    def input_files(self) -> list[Path]:
+        '''
+        The files from which the presentation is built.
+
+        This includes the source markdown, config file, HTML template, and stylesheet,
+        except for any that were passed as file-like objects.
+
+        Returns
+        -------
+        list[Path]
+            The paths of the input files, without duplicates.
+        '''
+        paths = list(self._input_paths)
+        for f in (self.html_template, self.stylesheet):
+            if isinstance(f, (str, Path)):
+                paths.append(Path(f))
+        return list(dict.fromkeys(paths))
 
     # Provide some properties to make access of configuration easier.
     @property
@@ -132,34 +193,53 @@ class Presentation:
         str
             An HTML rendering of the presentation.
         '''
-        template = Template(contents_of_file_coercible(self.html_template))
-        styles = contents_of_file_coercible(self.stylesheet)
+        template = default_cache.get_template(self.html_template)
+        return template.render(**self._template_context())
+
+    def iter_html(self) -> Iterator[str]:
+        '''
+        Convert the presentation to HTML, piece by piece.
+
+        Unlike `to_html`, this never holds the full rendering in memory at once.
+
+        Returns
+        -------
+        Iterator[str]
+            Consecutive chunks of the HTML rendering of the presentation.
+        '''
+        template = default_cache.get_template(self.html_template)
+        return template.generate(**self._template_context())
+
+    def write_html(self, fp: Writable) -> None:
+        '''
+        Write the HTML rendering of the presentation to a file, as it's generated.
+
+        Parameters
+        ----------
+        fp
+            A writable file-like object, opened in text mode.
+        '''
+        for chunk in self.iter_html():
+            fp.write(chunk)
+
+    def _template_context(self) -> dict[str, Any]:
+        '''The values to be substituted into the HTML template.'''
+        styles = default_cache.get_stylesheet(self.stylesheet)
         stylesheet_html = f"<style>\n{styles}\n</style>"
-        remark_args = json.dumps(self.remark_args)
-        return template.render(
-            title=self.title,
-            markdown=self.markdown,
-            stylesheet=stylesheet_html,
-            remark_args=remark_args,
-        )
+        # Default config values are read-only mappings, which json can't serialize.
+        remark_args = json.dumps(self.remark_args, default=dict)
+        return {
+            'title': self.title,
+            'markdown': self.markdown,
+            'stylesheet': stylesheet_html,
+            'remark_args': remark_args,
+        }
 
     def __add__(self, other: 'Presentation') -> 'Presentation':
         '''Concatenate presentations.'''
         if not isinstance(other, self.__class__):
             return NotImplemented
-        html_matches = (self.html_template == other.html_template)
-        style_matches = (self.stylesheet == other.stylesheet)
-        remark_matches = (self.remark_args == other.remark_args)
-        if html_matches and style_matches and remark_matches:
-            merged_markdown = self.markdown + '\n---\n' + other.markdown
-            return self.__class__(
-                markdown=merged_markdown,
-                **self.config
-            )
-        else:
-            msg = ('Cannot concatenate presentations unless they have the same HTML and'
-                   'stylesheet.')
-            raise TypeError(msg)
+        return self.from_presentations([self, other])
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
@@ -170,6 +250,12 @@ class Presentation:
             style_matches = (self.stylesheet == other.stylesheet)
             return (md_matches and html_matches and style_matches)
 
+    def _can_merge_with(self, other: 'Presentation') -> bool:
+        html_matches = (self.html_template == other.html_template)
+        style_matches = (self.stylesheet == other.stylesheet)
+        remark_matches = (self.remark_args == other.remark_args)
+        return html_matches and style_matches and remark_matches
+
     @classmethod
     def from_presentations(
         cls,
@@ -188,5 +274,26 @@ class Presentation:
         Presentation
             The resulting, merged presentation
         '''
-        # Because '+' is overloaded to concatenate, this merges the inputs.
-        return reduce(add, presentations)
+        presentations = list(presentations)
+        if not presentations:
+            raise ValueError('At least one presentation is required to merge.')
+        first = presentations[0]
+        if not all(first._can_merge_with(p) for p in presentations[1:]):
+            msg = ('Cannot concatenate presentations unless they have the same HTML and'
+                   'stylesheet.')
+            raise TypeError(msg)
+        # The merged presentation takes its config from the first one, except for
+        # sections, which have already been read into markdown.
+        config = PartialConfig({
+            key: val for key, val in first.config.items() if key != 'sections'
+        })
+        merged = cls.__new__(cls)
+        merged.config = ChainMap(config)
+        merged.source = None
+        merged.sections = [s for p in presentations for s in p.sections]
+        merged._input_paths = [f for p in presentations for f in p._input_paths]
+        merged._markdown_chunks = [
+            chunk for p in presentations for chunk in p._markdown_chunks
+        ]
+        merged._markdown = None
+        return merged
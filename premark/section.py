@@ -1,6 +1,9 @@
-from typing import Optional, Union, TypedDict, Iterable, Iterator
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Union, TypedDict, Iterable, Iterator
 from pathlib import Path
 
+from .cache import file_key
 from .utils import contents_of_file_coercible
 
 
@@ -110,3 +113,70 @@ class Section:
             )
         else:
             return md
+
+
+class SectionCache:
+    '''
+    The markdown of sections, kept until their files change.
+
+    Sharing a cache between successive builds of a presentation means that only the
+    sections that have changed are read again.
+    '''
+
+    def __init__(self) -> None:
+        # Maps each section to the version of its file that was read, and its markdown.
+        self._entries: dict[tuple[Any, ...], tuple[Any, str]] = {}
+        self._lock = threading.Lock()
+
+    def markdown(self, section: Section) -> str:
+        '''
+        Get the markdown of a section, reading its file only if it has changed.
+        '''
+        key = (section.filename, section.title, section.number)
+        version = file_key(section.filename)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        md = section.markdown()
+        with self._lock:
+            self._entries[key] = (version, md)
+        return md
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def read_sections(
+    sections: Iterable[Section],
+    jobs: Optional[int] = None,
+    cache: Optional[SectionCache] = None,
+) -> list[str]:
+    '''
+    Read the markdown of many sections, optionally in parallel.
+
+    Parameters
+    ----------
+    sections
+        The sections to read, e.g. as created by `Section.from_entries`.
+    jobs
+        The number of threads with which to read section files. If None or 1, files are
+        read one at a time.
+    cache
+        A cache from which to take the markdown of unchanged sections.
+
+    Returns
+    -------
+    The markdown of each section, in the same order as `sections`.
+    '''
+    if jobs is not None and jobs < 1:
+        raise ValueError('`jobs` must be at least 1.')
+    # Numbers are assigned as sections are created, so sections must be materialized
+    # before they're farmed out to threads.
+    sections = list(sections)
+    read = Section.markdown if cache is None else cache.markdown
+    if jobs is None or jobs == 1 or len(sections) <= 1:
+        return [read(s) for s in sections]
+    with ThreadPoolExecutor(max_workers=min(jobs, len(sections))) as executor:
+        return list(executor.map(read, sections))
@@ -1,6 +1,6 @@
 from pkg_resources import resource_filename
 from pathlib import Path
-from typing import runtime_checkable, Protocol, Union
+from typing import runtime_checkable, Any, Protocol, Union
 
 
 @runtime_checkable
@@ -8,6 +8,11 @@ class Readable(Protocol):
     def read(self) -> Union[str, bytes]: ...
 
 
+@runtime_checkable
+class Writable(Protocol):
+    def write(self, s: str, /) -> Any: ...
+
+
 FileCoercible = Union[str, Path, Readable]
 
 
@@ -0,0 +1,113 @@
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from .presentation import Presentation
+from .section import SectionCache
+
+
+FileVersion = Optional[tuple[int, int]]
+
+
+logger = logging.getLogger(__name__)
+
+
+def snapshot(paths: Iterable[Path]) -> dict[Path, FileVersion]:
+    '''
+    Record the modification time and size of files, or None for any that are missing.
+    '''
+    versions: dict[Path, FileVersion] = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            versions[path] = None
+        else:
+            versions[path] = (stat.st_mtime_ns, stat.st_size)
+    return versions
+
+
+class Watcher:
+    '''
+    Rebuild a presentation whenever one of its input files changes.
+
+    Rebuilds are incremental: the section markdown is cached between builds, so only
+    the sections that have changed are read again, and compiled templates stay cached
+    for the life of the process.
+
+    Parameters
+    ----------
+    on_build
+        Called with each newly built presentation, e.g. to write it to a file.
+    interval
+        The number of seconds to wait between checks for changes.
+    **presentation_args
+        The arguments with which to create each `Presentation`.
+    '''
+
+    def __init__(
+        self,
+        on_build: Callable[[Presentation], Any],
+        interval: float = 0.5,
+        **presentation_args: Any,
+    ):
+        self.on_build = on_build
+        self.interval = interval
+        self.presentation_args = presentation_args
+        self.section_cache = SectionCache()
+        self._versions: dict[Path, FileVersion] = {}
+
+    def build(self) -> Presentation:
+        '''
+        Build the presentation and pass it to `on_build`.
+        '''
+        prez = Presentation(**self.presentation_args, section_cache=self.section_cache)
+        self._versions = snapshot(prez.input_files())
+        self.on_build(prez)
+        return prez
+
+    def changed(self) -> bool:
+        '''
+        Whether any input file has changed since the last build.
+        '''
+        return snapshot(self._versions) != self._versions
+
+    def poll(self) -> bool:
+        '''
+        Rebuild the presentation if any of its inputs have changed.
+
+        A failed rebuild is logged rather than raised, since files are often briefly
+        invalid while being edited; it's attempted again on the next change.
+
+        Returns
+        -------
+        bool
+            Whether the presentation was successfully rebuilt.
+        '''
+        if not self.changed():
+            return False
+        logger.debug('Inputs changed, rebuilding presentation')
+        try:
+            self.build()
+        except Exception:
+            logger.exception('Failed to rebuild presentation')
+            self._versions = snapshot(self._versions)
+            return False
+        return True
+
+    def run(self, stop: Optional[threading.Event] = None) -> None:
+        '''
+        Build the presentation, then rebuild it each time its inputs change.
+
+        Parameters
+        ----------
+        stop
+            An event which, once set, stops watching. If None, watch forever.
+        '''
+        if stop is None:
+            stop = threading.Event()
+        self.build()
+        while not stop.wait(self.interval):
+            self.poll()
@@ -83,3 +83,17 @@ def test_with_custom_css():
     actual = prez.to_html()
     expected = CUSTOM_CSS_OUTPUT.read_text()
     assert_html_equiv(actual, expected)
+
+
+def test_titled_multi_section_in_parallel():
+    '''
+    Reading sections in parallel doesn't change their order or numbering.
+    '''
+    prez = Presentation(
+        SECTIONS_DIR,
+        config_file=SECTIONS_DIR / 'titled_sections.yaml',
+        jobs=4,
+    )
+    actual = prez.to_html()
+    expected = TITLED_SECTION_OUTPUT.read_text()
+    assert_html_equiv(actual, expected)
@@ -0,0 +1,82 @@
+import io
+import os
+from pathlib import Path
+
+import pytest
+
+from premark.cache import LRUCache, TemplateCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    # Touch 'a' so that 'b' becomes the oldest entry.
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+
+    assert 'b' not in cache
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert len(cache) == 2
+
+
+def test_lru_cache_rejects_bad_size():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+
+def test_template_compiled_once_per_file_version(tmp_path: Path):
+    '''
+    The same file gives the same template until the file changes.
+    '''
+    template_file = tmp_path / 'template.html'
+    template_file.write_text('<h1>{{ title }}</h1>')
+    cache = TemplateCache()
+
+    first = cache.get_template(template_file)
+    assert cache.get_template(str(template_file)) is first
+    assert first.render(title='Hi') == '<h1>Hi</h1>'
+
+    template_file.write_text('<h2>{{ title }}</h2>')
+    # Make sure the modification time moves even on coarse-grained filesystems.
+    stat = template_file.stat()
+    os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    second = cache.get_template(template_file)
+    assert second is not first
+    assert second.render(title='Hi') == '<h2>Hi</h2>'
+
+
+def test_file_like_templates_keyed_by_contents():
+    cache = TemplateCache()
+    first = cache.get_template(io.StringIO('{{ title }}!'))
+    second = cache.get_template(io.StringIO('{{ title }}!'))
+    other = cache.get_template(io.StringIO('{{ title }}?'))
+
+    assert first is second
+    assert other is not first
+
+
+def test_stylesheet_is_cached(tmp_path: Path, mocker):
+    css_file = tmp_path / 'styles.css'
+    css_file.write_text('h1 { color: red; }')
+    cache = TemplateCache()
+    assert cache.get_stylesheet(css_file) == 'h1 { color: red; }'
+
+    spy = mocker.spy(Path, 'read_text')
+    assert cache.get_stylesheet(css_file) == 'h1 { color: red; }'
+    spy.assert_not_called()
+
+
+def test_bytecode_cache_written_to_disk(tmp_path: Path):
+    template_file = tmp_path / 'template.html'
+    template_file.write_text('<p>{{ markdown }}</p>')
+    bytecode_dir = tmp_path / 'bytecode'
+    cache = TemplateCache(bytecode_cache_dir=bytecode_dir)
+    cache.get_template(template_file)
+    assert len(list(bytecode_dir.iterdir())) == 1
+
+    # A fresh cache (e.g. in a new process) loads the stored bytecode.
+    new_cache = TemplateCache(bytecode_cache_dir=bytecode_dir)
+    template = new_cache.get_template(template_file)
+    assert template.render(markdown='x') == '<p>x</p>'
@@ -22,6 +22,9 @@ def PrezMock():
         def to_html(self):
             return 'fake output'
 
+        def write_html(self, fp):
+            fp.write(self.to_html())
+
     return _PrezMock
 
 
@@ -44,7 +47,7 @@ def test_simple_invocation(runner, mocker, PrezMock):
         with open(source_file, 'wt') as f:
             f.write('# Slide 1\n---')
         result = runner.invoke(cli.premark, ['-o', out_file, source_file])
-        # The output file should contain the result of to_html()
+        # The output file should contain the rendered HTML.
         with open(out_file, 'rt') as f:
             assert f.read() == 'fake output'
 
@@ -55,6 +58,7 @@ def test_simple_invocation(runner, mocker, PrezMock):
         stylesheet=None,
         title=None,
         config_file=None,
+        jobs=None,
     )
 
 
@@ -82,7 +86,7 @@ def test_full_invocation(runner, mocker, PrezMock):
             '--config', config_file,
             source_file
         ])
-        # The output file should contain the result of to_html()
+        # The output file should contain the rendered HTML.
         with open(out_file, 'rt') as f:
             assert f.read() == 'fake output'
 
@@ -93,4 +97,30 @@ def test_full_invocation(runner, mocker, PrezMock):
         stylesheet=css_file,
         title=title,
         config_file=config_file,
+        jobs=None,
     )
+
+
+def test_jobs_option(runner, mocker, PrezMock):
+    '''
+    The number of jobs is passed to Presentation.
+    '''
+    mocker.patch('premark.cli.Presentation', PrezMock)
+    with runner.isolated_filesystem():
+        with open('slides.md', 'wt') as f:
+            f.write('# Slide 1\n---')
+        args = ['--jobs', '4', '-o', 'out.html', 'slides.md']
+        result = runner.invoke(cli.premark, args)
+
+    assert result.exit_code == 0
+    assert PrezMock.__init__.call_args.kwargs['jobs'] == 4
+
+
+def test_watch_requires_outfile(runner):
+    with runner.isolated_filesystem():
+        with open('slides.md', 'wt') as f:
+            f.write('# Slide 1\n---')
+        result = runner.invoke(cli.premark, ['--watch', 'slides.md'])
+
+    assert result.exit_code == 2
+    assert '--watch requires --outfile' in result.output
@@ -1,11 +1,13 @@
+import os
 from collections import ChainMap
 from pathlib import Path
 
 import pytest
+import yaml
 from yaml.error import YAMLError
 
 import premark
-from premark.config import PartialConfig
+from premark.config import PartialConfig, default_config
 
 
 def test_can_be_used_in_chain_map():
@@ -52,3 +54,38 @@ def test_interpolates_pkg_path():
     expected_path = Path(premark.__file__).parent / 'fakefile.py'
 
     assert p['fakefile'] == str(expected_path)
+
+
+def test_default_config_is_shared_and_read_only():
+    '''
+    The default config is parsed once and can't be modified.
+    '''
+    defaults = default_config()
+    assert default_config() is defaults
+    assert defaults['title'] == 'Premark Presentation'
+    with pytest.raises(TypeError):
+        defaults['title'] = 'Something else'  # type: ignore[index]
+    with pytest.raises(TypeError):
+        defaults['remark_args']['ratio'] = '4:3'
+
+
+def test_from_file_is_memoized_until_file_changes(tmp_path: Path, mocker):
+    '''
+    Reading the same unchanged file twice only parses it once.
+    '''
+    filepath = tmp_path / 'config.yaml'
+    filepath.write_text('title: First\nsections:\n- a.md\n')
+    spy = mocker.spy(yaml, 'load')
+    first = PartialConfig.from_file(filepath)
+    second = PartialConfig.from_file(filepath)
+    assert spy.call_count == 1
+    assert first == second
+    # Each caller gets its own mutable copy.
+    second['sections'].append('b.md')
+    assert first['sections'] == ['a.md']
+
+    filepath.write_text('title: Second\n')
+    stat = filepath.stat()
+    os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert PartialConfig.from_file(filepath)['title'] == 'Second'
+    assert spy.call_count == 2
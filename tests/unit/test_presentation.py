@@ -1,11 +1,15 @@
+import io
 from pathlib import Path
 
+import pytest
+
 from premark import Presentation
 
 
 DATA_DIR = Path(__file__).parent.parent / "data"
 CUSTOM_CSS = DATA_DIR / "custom.css"
 DEFAULT_SLIDES_PATH = DATA_DIR / "default_slides.md"
+SECTIONS_DIR = DATA_DIR / "sections"
 WITH_CUSTOM_CSS = DATA_DIR / "with_custom_css.html"
 
 
@@ -22,3 +26,40 @@ def test_equality():
     assert default_prez == Presentation(DEFAULT_SLIDES_PATH)
     custom_css_prez = Presentation(DEFAULT_SLIDES_PATH, stylesheet=CUSTOM_CSS)
     assert default_prez != custom_css_prez
+
+
+def test_streamed_html_matches_to_html():
+    prez = Presentation(DEFAULT_SLIDES_PATH)
+    chunks = list(prez.iter_html())
+    assert len(chunks) > 1
+    assert ''.join(chunks) == prez.to_html()
+
+    buffer = io.StringIO()
+    prez.write_html(buffer)
+    assert buffer.getvalue() == prez.to_html()
+
+
+def test_from_presentations_merges_in_order():
+    parts = [Presentation(markdown=f'# Part {i}') for i in range(50)]
+    merged = Presentation.from_presentations(parts)
+    assert merged.markdown == '\n---\n'.join(f'# Part {i}' for i in range(50))
+    assert merged == parts[0] + Presentation.from_presentations(parts[1:])
+
+
+def test_from_presentations_with_sections():
+    '''
+    Presentations built from section directories can be merged.
+    '''
+    sections = Presentation(SECTIONS_DIR, config_file=SECTIONS_DIR / 'sections.yaml')
+    merged = sections + Presentation(DEFAULT_SLIDES_PATH)
+    assert merged.markdown.startswith(sections.markdown + '\n---\n')
+    assert 'sections' not in merged.config
+
+
+def test_from_presentations_requires_compatible_inputs():
+    default_prez = Presentation(DEFAULT_SLIDES_PATH)
+    custom_css_prez = Presentation(DEFAULT_SLIDES_PATH, stylesheet=CUSTOM_CSS)
+    with pytest.raises(TypeError):
+        Presentation.from_presentations([default_prez, default_prez, custom_css_prez])
+    with pytest.raises(ValueError):
+        Presentation.from_presentations([])
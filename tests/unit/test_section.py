@@ -0,0 +1,25 @@
+from pathlib import Path
+
+import pytest
+
+from premark.section import Section, read_sections
+
+
+def test_read_sections_keeps_order(tmp_path: Path):
+    entries = []
+    for i in range(20):
+        (tmp_path / f'{i}.md').write_text(f'Slide {i}')
+        entries.append({'file': f'{i}.md', 'title': f'Part {i}'})
+    sections = Section.from_entries(entries, parent_dir=tmp_path)
+
+    markdowns = read_sections(sections, jobs=8)
+
+    assert len(markdowns) == 20
+    for i, md in enumerate(markdowns):
+        assert f'## #{i + 1}\n# Part {i}\n' in md
+        assert md.endswith(f'Slide {i}')
+
+
+def test_read_sections_rejects_bad_jobs(tmp_path: Path):
+    with pytest.raises(ValueError):
+        read_sections([], jobs=0)
@@ -0,0 +1,78 @@
+import os
+import threading
+from pathlib import Path
+
+from premark import section
+from premark.watch import Watcher
+
+
+def touch(path: Path, text: str) -> None:
+    '''Write to a file, making sure its modification time moves forward.'''
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def make_deck(tmp_path: Path) -> Path:
+    (tmp_path / 'a.md').write_text('# A')
+    (tmp_path / 'b.md').write_text('# B')
+    (tmp_path / 'premark.yaml').write_text('sections:\n- a.md\n- b.md\n')
+    return tmp_path / 'premark.yaml'
+
+
+def test_rebuilds_only_changed_sections(tmp_path: Path, mocker):
+    config = make_deck(tmp_path)
+    builds = []
+    watcher = Watcher(on_build=builds.append, source=tmp_path, config_file=config)
+    watcher.build()
+    assert not watcher.changed()
+
+    spy = mocker.spy(section, 'contents_of_file_coercible')
+    touch(tmp_path / 'b.md', '# B, revised')
+    assert watcher.changed()
+    watcher.build()
+
+    assert builds[-1].markdown == '# A\n---\n# B, revised'
+    assert [call.args[0].name for call in spy.call_args_list] == ['b.md']
+
+
+def test_watches_config_and_newly_listed_sections(tmp_path: Path):
+    config = make_deck(tmp_path)
+    builds = []
+    watcher = Watcher(on_build=builds.append, source=tmp_path, config_file=config)
+    watcher.build()
+
+    (tmp_path / 'c.md').write_text('# C')
+    assert not watcher.changed()
+    touch(config, 'sections:\n- a.md\n- b.md\n- c.md\n')
+    assert watcher.changed()
+    watcher.build()
+    assert builds[-1].markdown.endswith('# C')
+    assert tmp_path / 'c.md' in builds[-1].input_files()
+
+
+def test_poll_survives_failed_builds(tmp_path: Path):
+    config = make_deck(tmp_path)
+    builds = []
+    watcher = Watcher(on_build=builds.append, source=tmp_path, config_file=config)
+    watcher.build()
+    assert not watcher.poll()
+
+    touch(config, 'sections: [')
+    assert not watcher.poll()
+    # The broken config isn't retried until it changes again.
+    assert not watcher.changed()
+
+    touch(config, 'sections:\n- b.md\n')
+    assert watcher.poll()
+    assert builds[-1].markdown == '# B'
+
+
+def test_run_stops_when_told(tmp_path: Path):
+    config = make_deck(tmp_path)
+    stop = threading.Event()
+    stop.set()
+    builds = []
+    watcher = Watcher(on_build=builds.append, source=tmp_path, config_file=config)
+    watcher.run(stop=stop)
+    assert len(builds) == 1